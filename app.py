@@ -4,16 +4,35 @@ Zello Developer Portal - A platform engineering tool for service discovery and m
 Production-ready SQLite implementation with optimizations.
 """
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Request, g, request, render_template
 import os
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from typing import Dict, List, Optional
 import sqlite3
+import fcntl
+import gzip
+import hashlib
+import queue
+import threading
+import time
+from collections import Counter
+from functools import lru_cache, partial, wraps
+from types import MappingProxyType
+import orjson
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from sqlalchemy import event, lambda_stmt, select
+from sqlalchemy.pool import QueuePool
 
 # Import database models
-from models import db, Service, ServiceEvent, init_sample_data, optimize_database
+from models import db, Service, ServiceEvent, ServiceHealth, MaintenanceJob, init_sample_data, optimize_database, make_query_only
+
+class FastRequest(Request):
+    """Request that decodes JSON bodies with orjson (get_json only uses loads)"""
+    json_module = orjson
 
 app = Flask(__name__)
+app.request_class = FastRequest
 
 # Database configuration optimized for SQLite
 basedir = os.path.abspath(os.path.dirname(__file__))
@@ -22,19 +41,84 @@ db_path = os.path.join(data_dir, "developer_portal.db")
 
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024  # Bound request body size (and JSON parse cost)
+# Connections are kept open for the life of the process so the SQLite page
+# cache and mmap stay warm. Under WAL, readers don't block each other or the
+# writer, so reads get one pooled connection per gunicorn worker thread while
+# writes are serialized through a single writer connection.
+worker_threads = int(os.environ.get('WEB_THREADS', 4))
+
+sqlite_pool_options = {
+    'poolclass': QueuePool,
+    'max_overflow': 0,
     'pool_timeout': 20,
     'pool_recycle': -1,
-    'pool_pre_ping': True,
+    # JSON columns (de)serialize with orjson
+    'json_serializer': lambda obj: orjson.dumps(obj).decode(),
+    'json_deserializer': orjson.loads,
     'connect_args': {
         'timeout': 20,
-        'check_same_thread': False  # Allow multi-threading
+        # The pool hands a connection to one thread at a time, but it may be
+        # a different thread than the one that opened it
+        'check_same_thread': False
+    }
+}
+
+# Default engine: the writer
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {**sqlite_pool_options, 'pool_size': 1}
+app.config['SQLALCHEMY_BINDS'] = {
+    'reader': {
+        'url': app.config['SQLALCHEMY_DATABASE_URI'],
+        **sqlite_pool_options,
+        'pool_size': worker_threads
     }
 }
 
 # Initialize database
 db.init_app(app)
 
+with app.app_context():
+    event.listen(db.engines['reader'], 'connect', make_query_only)
+
+def read_only(view):
+    """Run a view's queries on the reader pool"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_read_only = True
+        return view(*args, **kwargs)
+    return wrapper
+
+# Encoded JSON payloads for read-heavy endpoints; cleared on every write
+response_cache = TTLCache(maxsize=16, ttl=10)
+response_cache_lock = threading.Lock()
+
+def cached_payload(name):
+    """Cache a payload builder's encoded JSON bytes, keyed by name and arguments"""
+    return cached(response_cache, key=partial(hashkey, name), lock=response_cache_lock)
+
+def invalidate_response_cache():
+    """Drop cached payloads after services change"""
+    with response_cache_lock:
+        response_cache.clear()
+
+def request_now():
+    """UTC time for the current request, computed at most once per request"""
+    if 'now_utc' not in g:
+        g.now_utc = datetime.utcnow()
+    return g.now_utc
+
+def page_count(total, per_page):
+    """Number of pages needed to show total rows, per_page at a time"""
+    return -(-total // per_page)
+
+def json_response(payload):
+    """Wrap already-encoded JSON bytes in a response"""
+    return app.response_class(payload, mimetype='application/json')
+
+def ojsonify(obj):
+    """Build a JSON response with orjson (datetimes are encoded natively)"""
+    return json_response(orjson.dumps(obj))
+
 def create_database():
     """Create database tables and initialize with sample data"""
     try:
@@ -61,6 +145,9 @@ def create_database():
         # Initialize with sample data if empty
         init_sample_data()
         
+        # Seed the rolling health table so status endpoints have data immediately
+        ServiceHealth.refresh()
+        
         print(f"✅ Database operations completed at: {db_path}")
         
     except Exception as e:
@@ -69,24 +156,54 @@ def create_database():
 
 # Web Routes
 
+@lru_cache(maxsize=None)
+def prerender_page(template_name):
+    """Render a static page once; returns (html, gzipped html, etag)"""
+    html = render_template(template_name).encode()
+    etag = hashlib.blake2b(html, digest_size=8).hexdigest()
+    return html, gzip.compress(html, 6), etag
+
+def serve_page(template_name):
+    """Serve a prerendered page, gzipped when accepted, with ETag revalidation"""
+    if app.debug:
+        # Re-render on every request so template edits show up during development
+        return render_template(template_name)
+    
+    html, html_gz, etag = prerender_page(template_name)
+    gzipped = 'gzip' in request.accept_encodings
+    if gzipped:
+        # The gzipped bytes differ from the identity body, so they need their own strong tag
+        etag += '-gz'
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    elif gzipped:
+        response = app.response_class(html_gz, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = app.response_class(html, mimetype='text/html')
+    response.set_etag(etag)
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/')
 def index():
     """Serve the dashboard page"""
-    return render_template('index.html')
+    return serve_page('index.html')
 
 @app.route('/services')
 def services():
     """Serve the services directory page"""
-    return render_template('services.html')
+    return serve_page('services.html')
 
 @app.route('/analytics')
 def analytics():
     """Serve the analytics page"""
-    return render_template('analytics.html')
+    return serve_page('analytics.html')
 
 # API Routes
 
 @app.route('/api/services', methods=['GET'])
+@read_only
 def list_services():
     """List all services with optional filtering and pagination"""
     try:
@@ -95,50 +212,62 @@ def list_services():
         language_filter = request.args.get('language')
         status_filter = request.args.get('status')
         page = max(1, int(request.args.get('page', 1)))
-        per_page = min(100, int(request.args.get('per_page', 50)))  # Limit to prevent large queries
-        
-        # Build query with filters (optimized with indexes)
-        query = Service.query
-        
-        if owner_filter:
-            query = query.filter(Service.owner == owner_filter)
-        if language_filter:
-            query = query.filter(Service.language == language_filter)
-        
-        # Order by created_at for consistent pagination
-        query = query.order_by(Service.created_at.desc())
-        
-        # Apply pagination
-        paginated = query.paginate(
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
-        
-        # Convert to dictionaries and apply status filter
-        services_data = []
-        for service in paginated.items:
-            service_dict = service.to_dict()
+        per_page = max(1, min(100, int(request.args.get('per_page', 50))))  # Limit to prevent large queries
+        
+        # Build statements with filters (optimized with indexes). Lambda statements
+        # cache their compiled SQL; the filter values become bound parameters.
+        def apply_filters(stmt):
+            if owner_filter:
+                stmt += lambda s: s.where(Service.owner == owner_filter)
+            if language_filter:
+                stmt += lambda s: s.where(Service.language == language_filter)
             
-            # Apply status filter if specified
-            if status_filter and service_dict['status'] != status_filter:
-                continue
-                
-            services_data.append(service_dict)
-        
-        return jsonify({
-            'services': services_data,
-            'total': paginated.total,
+            # Status filter is applied in SQL so pagination totals match the page
+            if status_filter == 'deployed':
+                stmt += lambda s: s.where(Service.deployed_version.isnot(None))
+            elif status_filter == 'undeployed':
+                stmt += lambda s: s.where(Service.deployed_version.is_(None))
+            elif status_filter:
+                # Same value the page displays: the swept status, falling back
+                # to the stored one for services the sweep hasn't reached yet
+                stmt += lambda s: s.where(
+                    db.func.coalesce(ServiceHealth.status, Service.health_status) == status_filter
+                )
+            return stmt
+        
+        # Both statements outer-join service_health so the status filter can see it
+        total = db.session.execute(apply_filters(lambda_stmt(
+            lambda: select(db.func.count(Service.id)).select_from(Service).outerjoin(ServiceHealth)
+        ))).scalar()
+        
+        # Order by created_at for consistent pagination; status comes from the
+        # health sweep so it is resolved in bulk rather than per row
+        offset = (page - 1) * per_page
+        page_stmt = apply_filters(lambda_stmt(lambda: select(
+            *Service.api_columns(), ServiceHealth.status.label('swept_status')
+        ).outerjoin(ServiceHealth)))
+        page_stmt += lambda s: s.order_by(Service.created_at.desc()).limit(per_page).offset(offset)
+        
+        # SQLite serializes the whole page; the JSON text is spliced in as-is
+        services_json = Service.to_json_bulk(page_stmt)
+        pages = page_count(total, per_page)
+        meta = {
+            'total': total,
             'page': page,
             'per_page': per_page,
-            'pages': paginated.pages,
-            'has_next': paginated.has_next,
-            'has_prev': paginated.has_prev
-        })
+            'pages': pages,
+            'has_next': page < pages,
+            'has_prev': page > 1
+        }
+        
+        ensure_health_sweeper()
+        return json_response(
+            b'{"services":' + services_json.encode() + b',' + orjson.dumps(meta)[1:]
+        )
         
     except Exception as e:
         app.logger.error(f'Error listing services: {str(e)}')
-        return jsonify({'error': 'Failed to retrieve services'}), 500
+        return ojsonify({'error': 'Failed to retrieve services'}), 500
 
 @app.route('/api/services', methods=['POST'])
 def register_service():
@@ -150,17 +279,17 @@ def register_service():
         required_fields = ['name', 'owner', 'language', 'repo']
         for field in required_fields:
             if not data.get(field):
-                return jsonify({'success': False, 'error': f'Missing required field: {field}'}), 400
+                return ojsonify({'success': False, 'error': f'Missing required field: {field}'}), 400
         
         # Validate service name format (optional but recommended)
         service_name = data['name'].strip()
         if not service_name or len(service_name) > 100:
-            return jsonify({'success': False, 'error': 'Service name must be 1-100 characters'}), 400
+            return ojsonify({'success': False, 'error': 'Service name must be 1-100 characters'}), 400
         
         # Check if service name already exists (uses unique index)
-        existing_service = Service.query.filter_by(name=service_name).first()
+        existing_service = Service.find_by_name(service_name)
         if existing_service:
-            return jsonify({'success': False, 'error': 'Service name already exists'}), 409
+            return ojsonify({'success': False, 'error': 'Service name already exists'}), 409
         
         # Create new service
         service = Service.create_service({
@@ -172,13 +301,13 @@ def register_service():
             'tags': data.get('tags', [])
         })
         
-        # First, add and commit the service to get a proper ID
+        # Flush to assign the service ID without ending the transaction
         db.session.add(service)
-        db.session.commit()  # Commit service first to get ID
+        db.session.flush()
         
-        # Now create the event with the proper service ID
+        # Create the creation event in the same transaction
         event = ServiceEvent.log_event(
-            service_id=service.id,  # Now service.id has a real value
+            service=service,
             event_type='created',
             event_data={
                 'name': service.name,
@@ -189,9 +318,10 @@ def register_service():
             created_by=request.headers.get('X-User-ID', 'unknown')
         )
         db.session.add(event)
-        db.session.commit()  # Commit the event
+        db.session.commit()  # Service and event are written in one transaction
+        invalidate_response_cache()
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'service_id': service.id,
             'message': f'Service {service.name} registered successfully',
@@ -201,46 +331,52 @@ def register_service():
     except Exception as e:
         db.session.rollback()
         app.logger.error(f'Error registering service: {str(e)}')
-        return jsonify({'success': False, 'error': 'Failed to register service'}), 500
+        return ojsonify({'success': False, 'error': 'Failed to register service'}), 500
+
+@cached_payload('services_status')
+def services_status_payload():
+    """Build the encoded status overview payload"""
+    # Get basic stats in one scan
+    deployment_stats = Service.get_deployment_stats()
+
+    # Get recent deployments (using index on deployed_at), loading only the columns shown
+    recent_deployments = db.session.execute(lambda_stmt(
+        lambda: select(Service.name, Service.deployed_version, Service.deployed_at, Service.owner)
+        .where(Service.deployed_at.isnot(None))
+        .order_by(Service.deployed_at.desc())
+        .limit(5)
+    )).all()
+
+    # Health status from the rolling service_health table (index-only GROUP BY)
+    health_counts = ServiceHealth.get_status_counts()
+
+    return orjson.dumps({
+        'summary': {
+            **deployment_stats,
+            'healthy': health_counts.get('healthy', 0),
+            'unhealthy': health_counts.get('unhealthy', 0)
+        },
+        'recent_deployments': [
+            {
+                'name': service.name,
+                'version': service.deployed_version,
+                'deployed_at': service.deployed_at,
+                'owner': service.owner
+            } for service in recent_deployments
+        ]
+    })
 
 @app.route('/api/services/status', methods=['GET'])
+@read_only
 def services_status():
     """Get status overview of all services with caching"""
     try:
-        # Get basic stats using optimized queries
-        total_services = Service.query.count()
-        deployed_services = Service.query.filter(Service.deployed_version.isnot(None)).count()
-        
-        # Get recent deployments (using index on deployed_at)
-        recent_deployments = Service.query.filter(
-            Service.deployed_at.isnot(None)
-        ).order_by(Service.deployed_at.desc()).limit(5).all()
-        
-        # Simulate health status (in production, this would come from real health checks)
-        healthy_count = int(total_services * 0.7)  # Simulate 70% healthy
-        unhealthy_count = total_services - healthy_count
-        
-        return jsonify({
-            'summary': {
-                'total_services': total_services,
-                'deployed_services': deployed_services,
-                'undeployed_services': total_services - deployed_services,
-                'healthy': healthy_count,
-                'unhealthy': unhealthy_count
-            },
-            'recent_deployments': [
-                {
-                    'name': service.name,
-                    'version': service.deployed_version,
-                    'deployed_at': service.deployed_at.isoformat(),
-                    'owner': service.owner
-                } for service in recent_deployments
-            ]
-        })
+        ensure_health_sweeper()
+        return json_response(services_status_payload())
         
     except Exception as e:
         app.logger.error(f'Error getting services status: {str(e)}')
-        return jsonify({'error': 'Failed to retrieve services status'}), 500
+        return ojsonify({'error': 'Failed to retrieve services status'}), 500
 
 @app.route('/api/services/<service_name>/deploy', methods=['POST'])
 def deploy_service(service_name):
@@ -250,15 +386,15 @@ def deploy_service(service_name):
         version = data.get('version', '').strip()
         
         if not version:
-            return jsonify({'success': False, 'error': 'Version is required'}), 400
+            return ojsonify({'success': False, 'error': 'Version is required'}), 400
         
         if len(version) > 50:
-            return jsonify({'success': False, 'error': 'Version must be 50 characters or less'}), 400
+            return ojsonify({'success': False, 'error': 'Version must be 50 characters or less'}), 400
         
         # Find service by name (uses unique index)
-        service = Service.query.filter_by(name=service_name).first()
+        service = Service.find_by_name(service_name)
         if not service:
-            return jsonify({'success': False, 'error': 'Service not found'}), 404
+            return ojsonify({'success': False, 'error': 'Service not found'}), 404
         
         # Store previous version for event logging
         old_version = service.deployed_version
@@ -266,12 +402,12 @@ def deploy_service(service_name):
         # Update deployment info
         service.update_deployment(version)
         
-        # Commit service changes first to ensure they're saved
-        db.session.commit()
+        # Flush service changes; the event is committed with them below
+        db.session.flush()
         
-        # Now log deployment event with the updated service
+        # Log deployment event with the updated service
         event = ServiceEvent.log_event(
-            service_id=service.id,
+            service=service,
             event_type='deployed',
             event_data={
                 'version': version,
@@ -282,8 +418,9 @@ def deploy_service(service_name):
         )
         db.session.add(event)
         db.session.commit()
+        invalidate_response_cache()
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'message': f'Successfully deployed {service_name} version {version}',
             'service': service.to_dict()
@@ -292,157 +429,172 @@ def deploy_service(service_name):
     except Exception as e:
         db.session.rollback()
         app.logger.error(f'Error deploying service {service_name}: {str(e)}')
-        return jsonify({'success': False, 'error': 'Failed to deploy service'}), 500
+        return ojsonify({'success': False, 'error': 'Failed to deploy service'}), 500
+
+# Next-steps guidance is static, so it is built once at import time.
+# Language keys are lowercase; lookups lowercase the service language once.
+BASE_NEXT_STEPS = (
+    "Review service documentation and API contracts",
+    "Set up monitoring and alerting for your service",
+    "Configure CI/CD pipeline for automated deployments"
+)
+
+LANGUAGE_GUIDES = MappingProxyType({
+    'python': {
+        'steps': (
+            "Set up Python virtual environment and dependencies",
+            "Configure pytest for unit testing",
+            "Add mypy for type checking",
+            "Set up pre-commit hooks for code quality"
+        ),
+        'templates': MappingProxyType({
+            "Python CI/CD Template": "https://github.com/example/python-cicd-template",
+            "Python Dockerfile": "https://github.com/example/python-dockerfile-template",
+            "FastAPI Template": "https://github.com/example/fastapi-template"
+        })
+    },
+    'javascript': {
+        'steps': (
+            "Set up npm scripts for testing and building",
+            "Configure Jest for unit testing",
+            "Add ESLint and Prettier for code quality",
+            "Set up Husky for git hooks"
+        ),
+        'templates': MappingProxyType({
+            "Node.js CI/CD Template": "https://github.com/example/nodejs-cicd-template",
+            "Node.js Dockerfile": "https://github.com/example/nodejs-dockerfile-template",
+            "Express.js Template": "https://github.com/example/express-template"
+        })
+    },
+    'typescript': {
+        'steps': (
+            "Configure TypeScript compilation settings",
+            "Set up Jest with ts-jest for testing",
+            "Add ESLint and Prettier with TypeScript rules",
+            "Configure path mapping for clean imports"
+        ),
+        'templates': MappingProxyType({
+            "TypeScript Node.js Template": "https://github.com/example/typescript-node-template",
+            "NestJS Template": "https://github.com/example/nestjs-template"
+        })
+    },
+    'java': {
+        'steps': (
+            "Configure Maven or Gradle build system",
+            "Set up JUnit for testing",
+            "Add SpotBugs for static analysis",
+            "Configure Checkstyle for code formatting"
+        ),
+        'templates': MappingProxyType({
+            "Java CI/CD Template": "https://github.com/example/java-cicd-template",
+            "Spring Boot Template": "https://github.com/example/spring-boot-template",
+            "Java Dockerfile": "https://github.com/example/java-dockerfile-template"
+        })
+    },
+    'go': {
+        'steps': (
+            "Set up Go modules and dependency management",
+            "Configure go test for unit testing",
+            "Add golangci-lint for code quality",
+            "Set up go generate for code generation"
+        ),
+        'templates': MappingProxyType({
+            "Go CI/CD Template": "https://github.com/example/go-cicd-template",
+            "Go Service Template": "https://github.com/example/go-service-template",
+            "Go Dockerfile": "https://github.com/example/go-dockerfile-template"
+        })
+    },
+    'rust': {
+        'steps': (
+            "Set up Cargo.toml with proper dependencies",
+            "Configure cargo test for unit testing",
+            "Add clippy for linting",
+            "Set up rustfmt for code formatting"
+        ),
+        'templates': MappingProxyType({
+            "Rust CI/CD Template": "https://github.com/example/rust-cicd-template",
+            "Rust Service Template": "https://github.com/example/rust-service-template"
+        })
+    }
+})
+
+UNDEPLOYED_STEPS = (
+    "Prepare your first deployment with version tagging",
+    "Set up staging environment for testing",
+    "Create deployment runbook and rollback procedures"
+)
+
+DEPLOYED_STEPS = (
+    "Monitor deployment metrics and logs",
+    "Set up automated rollback procedures",
+    "Plan for blue-green deployments"
+)
+
+TEAM_RECOMMENDATIONS = MappingProxyType({
+    'identity-team': ("Review OAuth 2.0 and security best practices", "Set up rate limiting"),
+    'data-team': ("Configure data retention policies", "Set up data quality monitoring"),
+    'platform-team': ("Review platform SLAs", "Set up cross-service monitoring"),
+    'communications-team': ("Set up message delivery tracking", "Configure retry policies")
+})
+
+COMMON_TEMPLATES = MappingProxyType({
+    "Service Documentation Template": "https://github.com/example/service-docs-template",
+    "Monitoring Setup Guide": "https://github.com/example/monitoring-guide",
+    "Security Checklist": "https://github.com/example/security-checklist",
+    "Load Testing Guide": "https://github.com/example/load-testing-guide"
+})
+
+@lru_cache(maxsize=256)
+def build_next_steps(language: str, deployed_version: Optional[str], owner: str):
+    """Build next steps and templates; a pure function of its inputs, so memoized"""
+    next_steps = list(BASE_NEXT_STEPS)
+    templates = {}
+    
+    # Add language-specific guidance
+    language_guide = LANGUAGE_GUIDES.get(language.lower())
+    if language_guide:
+        next_steps.extend(language_guide['steps'])
+        templates.update(language_guide['templates'])
+    
+    # Deployment-specific steps
+    if not deployed_version:
+        next_steps.extend(UNDEPLOYED_STEPS)
+    else:
+        next_steps.extend(DEPLOYED_STEPS)
+        next_steps.append(f"Consider upgrading from {deployed_version}")
+    
+    # Team-specific recommendations based on owner
+    next_steps.extend(TEAM_RECOMMENDATIONS.get(owner, ()))
+    
+    templates.update(COMMON_TEMPLATES)
+    
+    # Cached results are shared between requests, so hand out immutable values
+    return tuple(next_steps), MappingProxyType(templates)
 
 @app.route('/api/services/<service_name>/next-steps', methods=['GET'])
+@read_only
 def get_next_steps(service_name):
     """Get next steps and templates for a service"""
     try:
         # Find service by name (uses unique index)
-        service = Service.query.filter_by(name=service_name).first()
+        service = Service.find_by_name(service_name)
         if not service:
-            return jsonify({'error': 'Service not found'}), 404
+            return ojsonify({'error': 'Service not found'}), 404
         
         # Generate contextual next steps based on service language and deployment status
-        next_steps = []
-        templates = {}
-        
-        # Base next steps
-        next_steps.extend([
-            "Review service documentation and API contracts",
-            "Set up monitoring and alerting for your service",
-            "Configure CI/CD pipeline for automated deployments"
-        ])
-        
-        # Language-specific steps
-        language_guides = {
-            'python': {
-                'steps': [
-                    "Set up Python virtual environment and dependencies",
-                    "Configure pytest for unit testing",
-                    "Add mypy for type checking",
-                    "Set up pre-commit hooks for code quality"
-                ],
-                'templates': {
-                    "Python CI/CD Template": "https://github.com/example/python-cicd-template",
-                    "Python Dockerfile": "https://github.com/example/python-dockerfile-template",
-                    "FastAPI Template": "https://github.com/example/fastapi-template"
-                }
-            },
-            'javascript': {
-                'steps': [
-                    "Set up npm scripts for testing and building",
-                    "Configure Jest for unit testing",
-                    "Add ESLint and Prettier for code quality",
-                    "Set up Husky for git hooks"
-                ],
-                'templates': {
-                    "Node.js CI/CD Template": "https://github.com/example/nodejs-cicd-template",
-                    "Node.js Dockerfile": "https://github.com/example/nodejs-dockerfile-template",
-                    "Express.js Template": "https://github.com/example/express-template"
-                }
-            },
-            'typescript': {
-                'steps': [
-                    "Configure TypeScript compilation settings",
-                    "Set up Jest with ts-jest for testing",
-                    "Add ESLint and Prettier with TypeScript rules",
-                    "Configure path mapping for clean imports"
-                ],
-                'templates': {
-                    "TypeScript Node.js Template": "https://github.com/example/typescript-node-template",
-                    "NestJS Template": "https://github.com/example/nestjs-template"
-                }
-            },
-            'java': {
-                'steps': [
-                    "Configure Maven or Gradle build system",
-                    "Set up JUnit for testing",
-                    "Add SpotBugs for static analysis",
-                    "Configure Checkstyle for code formatting"
-                ],
-                'templates': {
-                    "Java CI/CD Template": "https://github.com/example/java-cicd-template",
-                    "Spring Boot Template": "https://github.com/example/spring-boot-template",
-                    "Java Dockerfile": "https://github.com/example/java-dockerfile-template"
-                }
-            },
-            'go': {
-                'steps': [
-                    "Set up Go modules and dependency management",
-                    "Configure go test for unit testing",
-                    "Add golangci-lint for code quality",
-                    "Set up go generate for code generation"
-                ],
-                'templates': {
-                    "Go CI/CD Template": "https://github.com/example/go-cicd-template",
-                    "Go Service Template": "https://github.com/example/go-service-template",
-                    "Go Dockerfile": "https://github.com/example/go-dockerfile-template"
-                }
-            },
-            'rust': {
-                'steps': [
-                    "Set up Cargo.toml with proper dependencies",
-                    "Configure cargo test for unit testing",
-                    "Add clippy for linting",
-                    "Set up rustfmt for code formatting"
-                ],
-                'templates': {
-                    "Rust CI/CD Template": "https://github.com/example/rust-cicd-template",
-                    "Rust Service Template": "https://github.com/example/rust-service-template"
-                }
-            }
-        }
-        
-        # Add language-specific guidance
-        language_guide = language_guides.get(service.language.lower())
-        if language_guide:
-            next_steps.extend(language_guide['steps'])
-            templates.update(language_guide['templates'])
-        
-        # Deployment-specific steps
-        if not service.deployed_version:
-            next_steps.extend([
-                "Prepare your first deployment with version tagging",
-                "Set up staging environment for testing",
-                "Create deployment runbook and rollback procedures"
-            ])
-        else:
-            next_steps.extend([
-                "Monitor deployment metrics and logs",
-                "Set up automated rollback procedures",
-                "Plan for blue-green deployments",
-                f"Consider upgrading from {service.deployed_version}"
-            ])
-        
-        # Team-specific recommendations based on owner
-        team_recommendations = {
-            'identity-team': ["Review OAuth 2.0 and security best practices", "Set up rate limiting"],
-            'data-team': ["Configure data retention policies", "Set up data quality monitoring"],
-            'platform-team': ["Review platform SLAs", "Set up cross-service monitoring"],
-            'communications-team': ["Set up message delivery tracking", "Configure retry policies"]
-        }
-        
-        if service.owner in team_recommendations:
-            next_steps.extend(team_recommendations[service.owner])
-        
-        # Common templates
-        templates.update({
-            "Service Documentation Template": "https://github.com/example/service-docs-template",
-            "Monitoring Setup Guide": "https://github.com/example/monitoring-guide",
-            "Security Checklist": "https://github.com/example/security-checklist",
-            "Load Testing Guide": "https://github.com/example/load-testing-guide"
-        })
+        next_steps, templates = build_next_steps(
+            service.language, service.deployed_version, service.owner
+        )
         
-        return jsonify({
+        return ojsonify({
             'service_name': service_name,
             'next_steps': next_steps,
-            'templates': templates,
+            'templates': dict(templates),
             'service_info': {
                 'owner': service.owner,
                 'language': service.language,
                 'deployed_version': service.deployed_version,
-                'deployed_at': service.deployed_at.isoformat() if service.deployed_at else None,
+                'deployed_at': service.deployed_at,
                 'tags': service.parse_tags(),
                 'description': service.description
             }
@@ -450,174 +602,308 @@ def get_next_steps(service_name):
         
     except Exception as e:
         app.logger.error(f'Error getting next steps for {service_name}: {str(e)}')
-        return jsonify({'error': 'Failed to retrieve next steps'}), 500
+        return ojsonify({'error': 'Failed to retrieve next steps'}), 500
 
 @app.route('/api/services/<service_name>/events', methods=['GET'])
+@read_only
 def get_service_events(service_name):
     """Get event history for a service"""
     try:
         # Find service by name
-        service = Service.query.filter_by(name=service_name).first()
+        service = Service.find_by_name(service_name)
         if not service:
-            return jsonify({'error': 'Service not found'}), 404
+            return ojsonify({'error': 'Service not found'}), 404
         
         # Get pagination parameters
         page = max(1, int(request.args.get('page', 1)))
-        per_page = min(50, int(request.args.get('per_page', 20)))
+        per_page = max(1, min(50, int(request.args.get('per_page', 20))))
         
         # Get events with pagination (uses composite index)
-        events = ServiceEvent.query.filter_by(service_id=service.id)\
-            .order_by(ServiceEvent.created_at.desc())\
-            .paginate(page=page, per_page=per_page, error_out=False)
-        
-        return jsonify({
+        service_id = service.id
+        offset = (page - 1) * per_page
+        total = db.session.execute(lambda_stmt(
+            lambda: select(db.func.count(ServiceEvent.id)).where(ServiceEvent.service_id == service_id)
+        )).scalar()
+        events = db.session.execute(lambda_stmt(
+            lambda: select(*ServiceEvent.api_columns())
+            .where(ServiceEvent.service_id == service_id)
+            .order_by(ServiceEvent.created_at.desc())
+            .limit(per_page)
+            .offset(offset)
+        ))
+        
+        return ojsonify({
             'service_name': service_name,
-            'events': [event.to_dict() for event in events.items],
-            'total': events.total,
+            'events': [ServiceEvent.row_to_dict(row) for row in events],
+            'total': total,
             'page': page,
             'per_page': per_page,
-            'pages': events.pages
+            'pages': page_count(total, per_page)
         })
         
     except Exception as e:
         app.logger.error(f'Error getting events for {service_name}: {str(e)}')
-        return jsonify({'error': 'Failed to retrieve service events'}), 500
+        return ojsonify({'error': 'Failed to retrieve service events'}), 500
+
+@cached_payload('analytics_overview')
+def analytics_overview_payload(days):
+    """Build the encoded analytics payload for the last N days"""
+    deployment_stats = Service.get_deployment_stats()
+
+    # Per-type event counts from one GROUP BY over idx_event_type_date
+    events_by_type = ServiceEvent.get_activity_summary(days)
+    activity_stats = {'total_events': sum(events_by_type.values()), 'by_type': events_by_type}
+
+    # Get language and team distributions from a single pass over both columns
+    # (served as an index-only scan of idx_owner_lang_created)
+    language_distribution = Counter()
+    team_distribution = Counter()
+    for language, owner in db.session.execute(db.text("SELECT language, owner FROM services")):
+        language_distribution[language] += 1
+        team_distribution[owner] += 1
+
+    # Get recent activity from service events
+    recent_events = db.session.execute(
+        select(*ServiceEvent.api_columns()).order_by(ServiceEvent.created_at.desc()).limit(10)
+    )
+
+    # Get services status summary for health stats
+    health_counts = ServiceHealth.get_status_counts()
+
+    return orjson.dumps({
+        'period_days': days,
+        'deployment_stats': deployment_stats,
+        'activity_stats': activity_stats,
+        'language_distribution': language_distribution,
+        'team_distribution': team_distribution,
+        'recent_activity': [ServiceEvent.row_to_dict(row) for row in recent_events],
+        'summary': {
+            'total_services': deployment_stats['total_services'],
+            'deployed_services': deployment_stats['deployed_services'],
+            'healthy': health_counts.get('healthy', 0),
+            'unhealthy': health_counts.get('unhealthy', 0)
+        }
+    })
 
 @app.route('/api/analytics/overview', methods=['GET'])
+@read_only
 def analytics_overview():
     """Get analytics overview with performance optimizations"""
     try:
         # Get time range (default to last 30 days)
         days = min(365, int(request.args.get('days', 30)))
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        
-        # Get deployment stats manually since the method might not exist
-        total_services = Service.query.count()
-        deployed_services = Service.query.filter(Service.deployed_version.isnot(None)).count()
-        deployment_stats = {
-            'total_services': total_services,
-            'deployed_services': deployed_services,
-            'undeployed_services': total_services - deployed_services
-        }
-        
-        # Get activity stats manually
-        activity_count = ServiceEvent.query.filter(ServiceEvent.created_at >= cutoff_date).count()
-        activity_stats = {'total_events': activity_count}
-        
-        # Get language distribution (uses index)
-        language_stats = db.session.query(
-            Service.language,
-            db.func.count(Service.id).label('count')
-        ).group_by(Service.language).all()
-        
-        # Get team distribution (uses index)
-        team_stats = db.session.query(
-            Service.owner,
-            db.func.count(Service.id).label('count')
-        ).group_by(Service.owner).all()
-        
-        # Get recent activity from service events
-        recent_events = ServiceEvent.query.order_by(ServiceEvent.created_at.desc()).limit(10).all()
-        
-        # Get services status summary for health stats
-        services = Service.query.all()
-        healthy_count = int(len(services) * 0.7)  # Simulate 70% healthy
-        unhealthy_count = len(services) - healthy_count
-        
-        return jsonify({
-            'period_days': days,
-            'deployment_stats': deployment_stats,
-            'activity_stats': activity_stats,
-            'language_distribution': {lang: count for lang, count in language_stats},
-            'team_distribution': {team: count for team, count in team_stats},
-            'recent_activity': [event.to_dict() for event in recent_events],
-            'summary': {
-                'total_services': len(services),
-                'deployed_services': deployment_stats.get('deployed_services', 0),
-                'healthy': healthy_count,
-                'unhealthy': unhealthy_count
-            }
-        })
+        ensure_health_sweeper()
+        return json_response(analytics_overview_payload(days))
         
     except Exception as e:
         app.logger.error(f'Error getting analytics overview: {str(e)}')
         import traceback
         print(f"Analytics error: {e}")
         print(traceback.format_exc())
-        return jsonify({'error': f'Failed to retrieve analytics: {str(e)}'}), 500
+        return ojsonify({'error': f'Failed to retrieve analytics: {str(e)}'}), 500
+
+@cached_payload('filters')
+def filters_payload():
+    """Build the encoded filter options payload"""
+    return orjson.dumps({
+        'owners': Service.get_owners(),
+        'languages': Service.get_languages()
+    })
 
 @app.route('/api/filters', methods=['GET'])
+@read_only
 def get_filters():
     """Get available filter options (cached for performance)"""
     try:
-        return jsonify({
-            'owners': Service.get_owners(),
-            'languages': Service.get_languages()
-        })
+        return json_response(filters_payload())
     except Exception as e:
         app.logger.error(f'Error getting filters: {str(e)}')
-        return jsonify({'error': 'Failed to retrieve filters'}), 500
+        return ojsonify({'error': 'Failed to retrieve filters'}), 500
 
 @app.route('/health', methods=['GET'])
+@read_only
 def health_check():
     """Health check endpoint with database connectivity test"""
     try:
         # Test database connectivity
-        with db.engine.connect() as conn:
-            conn.execute(db.text('SELECT 1'))
+        db.session.execute(db.text('SELECT 1'))
         
-        # Get basic stats
-        service_count = Service.query.count()
+        # Get basic stats (estimated from planner statistics; no table scan)
+        service_count = Service.estimate_count()
         
-        return jsonify({
+        return ojsonify({
             'status': 'healthy',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': request_now(),
             'database': 'connected',
             'services_count': service_count,
             'version': '1.0.0'
         })
     except Exception as e:
         app.logger.error(f'Health check failed: {str(e)}')
-        return jsonify({
+        return ojsonify({
             'status': 'unhealthy',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': request_now(),
             'error': 'Database connection failed'
         }), 503
 
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': 'Not found'}), 404
+    return ojsonify({'error': 'Not found'}), 404
 
 @app.errorhandler(500)
 def internal_error(error):
     db.session.rollback()
-    return jsonify({'error': 'Internal server error'}), 500
+    return ojsonify({'error': 'Internal server error'}), 500
 
 @app.errorhandler(400)
 def bad_request(error):
-    return jsonify({'error': 'Bad request'}), 400
+    return ojsonify({'error': 'Bad request'}), 400
+
+# Database maintenance runs on a background thread: VACUUM rewrites the whole
+# file under an exclusive lock, so it must never run on a request thread
+maintenance_queue = queue.Queue()
+maintenance_thread = None
+maintenance_thread_lock = threading.Lock()
+
+def run_maintenance_job(job_id):
+    """Checkpoint, VACUUM and ANALYZE on a dedicated connection, recording progress"""
+    conn = sqlite3.connect(db_path, isolation_level=None, timeout=20)
+    try:
+        conn.execute(
+            "UPDATE maintenance_jobs SET status = 'running', started_at = ? WHERE id = ?",
+            (datetime.utcnow().isoformat(sep=' '), job_id)
+        )
+        try:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            conn.execute('VACUUM')
+            conn.execute('ANALYZE')
+        except Exception as e:
+            app.logger.error(f'Database vacuum job {job_id} failed: {str(e)}')
+            conn.execute(
+                "UPDATE maintenance_jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                (str(e), datetime.utcnow().isoformat(sep=' '), job_id)
+            )
+        else:
+            conn.execute(
+                "UPDATE maintenance_jobs SET status = 'completed', finished_at = ? WHERE id = ?",
+                (datetime.utcnow().isoformat(sep=' '), job_id)
+            )
+    finally:
+        conn.close()
+
+def maintenance_worker():
+    """Process queued maintenance jobs one at a time"""
+    while True:
+        job_id = maintenance_queue.get()
+        try:
+            run_maintenance_job(job_id)
+        except Exception as e:
+            app.logger.error(f'Maintenance job {job_id} could not be recorded: {str(e)}')
+        finally:
+            maintenance_queue.task_done()
+
+def enqueue_maintenance_job(job_id):
+    """Queue a job, starting this process's worker thread on first use"""
+    global maintenance_thread
+    with maintenance_thread_lock:
+        if maintenance_thread is None or not maintenance_thread.is_alive():
+            maintenance_thread = threading.Thread(
+                target=maintenance_worker, name='db-maintenance', daemon=True
+            )
+            maintenance_thread.start()
+    maintenance_queue.put(job_id)
+
+# Service health is re-derived by a background sweep into service_health, so
+# status endpoints read one small aggregate instead of probing every service.
+# Only one process sweeps: whichever gunicorn worker holds an exclusive lock on
+# a file beside the database. The OS drops the lock if that worker exits, and
+# the next worker to serve a status request takes over.
+health_sweep_interval = int(os.environ.get('HEALTH_SWEEP_INTERVAL', 30))
+health_sweep_lock_path = db_path + '.sweep.lock'
+health_sweep_lock_file = None
+health_sweeper = None
+health_sweeper_lock = threading.Lock()
+
+def health_sweep_worker():
+    """Refresh service_health every health_sweep_interval seconds"""
+    while True:
+        try:
+            with app.app_context():
+                ServiceHealth.refresh()
+        except Exception as e:
+            app.logger.error(f'Health sweep failed: {str(e)}')
+        time.sleep(health_sweep_interval)
+
+def acquire_health_sweep_lock():
+    """Take the cross-process sweep lock without blocking; True if this process holds it"""
+    global health_sweep_lock_file
+    if health_sweep_lock_file is not None:
+        return True
+    lock_file = open(health_sweep_lock_path, 'a')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        # Another worker is sweeping
+        lock_file.close()
+        return False
+    # Kept open for the life of the process; closing it would release the lock
+    health_sweep_lock_file = lock_file
+    return True
+
+def ensure_health_sweeper():
+    """Start the health sweep thread if no process is running one"""
+    global health_sweeper
+    if health_sweeper is not None and health_sweeper.is_alive():
+        return
+    with health_sweeper_lock:
+        if not acquire_health_sweep_lock():
+            return
+        if health_sweeper is None or not health_sweeper.is_alive():
+            health_sweeper = threading.Thread(
+                target=health_sweep_worker, name='health-sweep', daemon=True
+            )
+            health_sweeper.start()
 
 @app.route('/api/admin/vacuum', methods=['POST'])
 def vacuum_database():
-    """Vacuum database to reclaim space and optimize (admin only)"""
+    """Queue a database vacuum to reclaim space and optimize (admin only)"""
     try:
         # In production, add authentication here
-        with db.engine.connect() as conn:
-            conn.execute(db.text('VACUUM'))
-            conn.execute(db.text('ANALYZE'))
-            conn.commit()
+        job = MaintenanceJob(job_type='vacuum')
+        db.session.add(job)
+        db.session.commit()
+        
+        enqueue_maintenance_job(job.id)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
-            'message': 'Database optimized successfully'
-        })
+            'job_id': job.id,
+            'status': job.status,
+            'message': 'Database optimization queued'
+        }), 202
     except Exception as e:
+        db.session.rollback()
         app.logger.error(f'Database vacuum failed: {str(e)}')
-        return jsonify({'error': 'Database optimization failed'}), 500
+        return ojsonify({'error': 'Database optimization failed'}), 500
+
+@app.route('/api/admin/vacuum/<job_id>', methods=['GET'])
+@read_only
+def get_vacuum_job(job_id):
+    """Get the status of a queued database vacuum (admin only)"""
+    try:
+        job = db.session.get(MaintenanceJob, job_id)
+        if not job:
+            return ojsonify({'error': 'Job not found'}), 404
+        
+        return ojsonify(job.to_dict())
+    except Exception as e:
+        app.logger.error(f'Error getting vacuum job {job_id}: {str(e)}')
+        return ojsonify({'error': 'Failed to retrieve job status'}), 500
 
 if __name__ == '__main__':
-    # Database initialization is now handled by entrypoint.sh
+    # Local development server only - Docker runs the app under gunicorn
+    # (see entrypoint.sh). Database initialization is handled by entrypoint.sh
     # Only create database if running directly (not in Docker)
     if not os.environ.get('DATA_DIR'):
         print("🔧 Running outside Docker - initializing database...")
@@ -645,7 +931,8 @@ if __name__ == '__main__':
       - GET  /api/analytics/overview (analytics dashboard)
       - GET  /api/filters (filter options)
       - GET  /health (system health)
-      - POST /api/admin/vacuum (database maintenance)
+      - POST /api/admin/vacuum (queue database maintenance)
+      - GET  /api/admin/vacuum/<job_id> (maintenance job status)
     
     🚀 Optimizations Applied:
       - WAL mode for better concurrency
@@ -67,6 +67,13 @@ except Exception as e:
     " 2>/dev/null || echo "0")
     
     echo "📊 Found $SERVICE_COUNT existing services in database"
+    
+    # Re-run initialization to backfill indexes added since the database was created
+    # (existing data is left untouched)
+    if ! python init_db.py; then
+        echo "❌ Database schema update failed"
+        exit 1
+    fi
 fi
 
 # Verify the volume mount is working
@@ -75,6 +82,11 @@ echo "  DATA_DIR: $DATA_DIR"
 echo "  Database exists: $([ -f "$DB_PATH" ] && echo "YES" || echo "NO")"
 echo "  Database size: $([ -f "$DB_PATH" ] && du -h "$DB_PATH" 2>/dev/null || echo "N/A")"
 
-# Start the Flask application
+# Start the application under gunicorn (threaded workers, one SQLite
+# connection pool per worker process)
 echo "🌐 Starting web server on port ${PORT:-5001}..."
-exec python app.py
\ No newline at end of file
+exec gunicorn -k gthread \
+    --workers "${WEB_CONCURRENCY:-2}" \
+    --threads "${WEB_THREADS:-4}" \
+    --bind "0.0.0.0:${PORT:-5001}" \
+    app:app
\ No newline at end of file
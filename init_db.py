@@ -7,7 +7,7 @@ Run this script to create the database and initialize sample data
 import os
 import sys
 from app import app, db
-from models import Service, ServiceEvent, init_sample_data, optimize_database
+from models import Service, ServiceEvent, ServiceHealth, init_sample_data, optimize_database
 
 def init_database():
     """Initialize the database with tables and sample data"""
@@ -43,6 +43,7 @@ def init_database():
             existing_services = Service.query.count()
             if existing_services > 0:
                 print(f"ℹ️ Database already contains {existing_services} services")
+                ServiceHealth.refresh()
                 if '--force-sample-data' not in sys.argv:
                     print("✅ Database initialization complete!")
                     return
@@ -51,6 +52,9 @@ def init_database():
             print("📦 Adding sample data...")
             init_sample_data()
             
+            # Seed the rolling health table
+            ServiceHealth.refresh()
+            
             # Verify initialization
             service_count = Service.query.count()
             event_count = ServiceEvent.query.count()
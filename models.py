@@ -3,13 +3,146 @@ Database models for the Zello Developer Portal
 Optimized for SQLite with proper indexing and performance considerations
 """
 
+from flask import g, has_request_context
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from flask_sqlalchemy.session import Session
+from sqlalchemy import BigInteger, LargeBinary, TypeDecorator, event, insert, lambda_stmt, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import object_session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.schema import CreateTable, DefaultClause
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Tuple
+import random
+import sqlite3
+import time
 import uuid
-import json
 
-db = SQLAlchemy()
+class RoutingSession(Session):
+    """Session that sends read-only requests to the reader engine.
+    
+    Views marked read-only (see app.read_only) run against the 'reader' bind,
+    a pool of query_only connections that WAL lets proceed in parallel.
+    Everything else, including work outside a request, uses the default
+    (writer) engine.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context() and g.get('db_read_only'):
+            return self._db.engines['reader']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+# Primary keys are version 4 UUIDs generated by SQLite rather than by Python
+# for every inserted row; the ORM reads them back with RETURNING. Bytes 6 and
+# 8 are drawn from tables of the values that carry the version and RFC 4122
+# variant bits (SQLite 3.40 has no unhex() or byte-level bit operations).
+# || yields text, hence the CAST back to a blob.
+UUID4_VERSION_BYTES = ''.join(f'{byte:02X}' for byte in range(0x40, 0x50))
+UUID4_VARIANT_BYTES = ''.join(f'{byte:02X}' for byte in range(0x80, 0xC0))
+RANDOM_ID = db.text(
+    f"(CAST(randomblob(6) || substr(X'{UUID4_VERSION_BYTES}', 1 + (random() & 15), 1) || randomblob(1)"
+    f" || substr(X'{UUID4_VARIANT_BYTES}', 1 + (random() & 63), 1) || randomblob(7) AS BLOB))"
+)
+
+# How long a recorded health check stays authoritative
+HEALTH_CHECK_TTL = timedelta(minutes=5)
+
+# Per-connection settings, applied once when the pool opens a connection.
+# Pooled connections stay open, so the page cache and mmap stay hot.
+# page_size only applies to a new, empty database (a WAL database keeps its
+# page size even across VACUUM), so it has to come before journal_mode.
+CONNECTION_PRAGMAS = (
+    'PRAGMA page_size=8192',
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA busy_timeout=5000',
+)
+
+
+@event.listens_for(Engine, 'connect')
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """Apply SQLite tuning PRAGMAs to every new pooled connection"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    for pragma in CONNECTION_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def make_query_only(dbapi_connection, connection_record):
+    """Reject writes on reader-pool connections"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA query_only=1')
+    cursor.close()
+
+
+class UnixDateTime(TypeDecorator):
+    """Naive UTC datetime stored as INTEGER unix seconds.
+    
+    Integers take fewer bytes than ISO text in rows and index pages and
+    compare as plain numbers; sub-second precision is dropped.
+    """
+    
+    impl = BigInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(value.replace(tzinfo=timezone.utc).timestamp())
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
+
+class UUIDBlob(TypeDecorator):
+    """UUID string stored as a 16-byte BLOB.
+    
+    Keys and the indexes and foreign keys that repeat them are less than half
+    the size of 36-character text; the API still sees the dashed string.
+    """
+    
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, bytes):
+            return value
+        return uuid.UUID(value).bytes
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=value))
+
+
+def uuid_text(column):
+    """SQL expression giving a UUIDBlob column as its dashed string"""
+    hex_id = db.func.lower(db.func.hex(column))
+    return db.func.printf(
+        '%s-%s-%s-%s-%s',
+        *(db.func.substr(hex_id, start, length) for start, length in
+          ((1, 8), (9, 4), (13, 4), (17, 4), (21, 12)))
+    )
+
+
+def iso_timestamp(column):
+    """Project a UnixDateTime column as the string datetime.isoformat() would give.
+    
+    Formatting in SQL skips building a datetime per value only to encode it again.
+    """
+    return db.func.strftime('%Y-%m-%dT%H:%M:%S', column, 'unixepoch').label(column.key)
+
 
 class Service(db.Model):
     """Service model for storing registered services"""
@@ -17,43 +150,48 @@ class Service(db.Model):
     __tablename__ = 'services'
     
     # Primary key and unique identifiers
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDBlob, primary_key=True, server_default=RANDOM_ID)
     name = db.Column(db.String(100), nullable=False, unique=True)
     
     # Core service metadata with indexes for filtering
-    owner = db.Column(db.String(100), nullable=False, index=True)
-    language = db.Column(db.String(50), nullable=False, index=True)
+    owner = db.Column(db.String(100), nullable=False)
+    language = db.Column(db.String(50), nullable=False)
     repo = db.Column(db.String(500), nullable=False)
     
     # Timestamps with indexes for sorting
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
-    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(UnixDateTime, nullable=False, default=datetime.utcnow, index=True)
+    updated_at = db.Column(UnixDateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Deployment tracking
     deployed_version = db.Column(db.String(50), nullable=True)
-    deployed_at = db.Column(db.DateTime, nullable=True, index=True)  # Index for deployment queries
+    deployed_at = db.Column(UnixDateTime, nullable=True)  # Partial index below for deployment queries
     
     # Extended metadata
     description = db.Column(db.Text, nullable=True)
-    tags = db.Column(db.Text, nullable=True)  # JSON string of tags
+    tags = db.Column(db.JSON(none_as_null=True), nullable=True)  # JSON list of tags
     
     # Health status cache (updated periodically)
-    last_health_check = db.Column(db.DateTime, nullable=True)
+    last_health_check = db.Column(UnixDateTime, nullable=True)
     health_status = db.Column(db.String(20), nullable=True, default='unknown')
     
     # Performance optimization: composite indexes
     __table_args__ = (
-        db.Index('idx_owner_language', 'owner', 'language'),
+        db.Index('idx_owner_lang_created', 'owner', 'language', 'created_at'),
         db.Index('idx_language_created', 'language', 'created_at'),
         db.Index('idx_owner_created', 'owner', 'created_at'),
         db.Index('idx_deployment_status', 'deployed_version', 'deployed_at'),
+        db.Index('idx_deployed_created', 'deployed_version', 'created_at'),
+        db.Index('idx_deployed_at', 'deployed_at', sqlite_where=db.text('deployed_at IS NOT NULL')),
     )
     
     def __repr__(self):
         return f'<Service {self.name}>'
     
-    def to_dict(self, include_status: bool = True) -> Dict[str, Any]:
-        """Convert service to dictionary for API responses"""
+    def to_dict(self, include_status: bool = True, status: Optional[str] = None) -> Dict[str, Any]:
+        """Convert service to dictionary for API responses.
+        
+        Pass status when the caller already resolved it in bulk.
+        """
         result = {
             'id': self.id,
             'name': self.name,
@@ -65,34 +203,97 @@ class Service(db.Model):
             'deployed_version': self.deployed_version,
             'deployed_at': self.deployed_at.isoformat() if self.deployed_at else None,
             'description': self.description,
-            'tags': self.parse_tags() if self.tags else []
+            'tags': self.tags or []
         }
         
         # Add health status
         if include_status:
-            # Use cached status if recent (within 5 minutes), otherwise simulate
-            if (self.last_health_check and 
-                (datetime.utcnow() - self.last_health_check).seconds < 300):
-                result['status'] = self.health_status
-            else:
-                # Simulate health check (30% chance of being unhealthy)
-                import random
-                result['status'] = 'healthy' if random.random() > 0.3 else 'unhealthy'
+            result['status'] = status or self.current_status()
         
         return result
     
+    @classmethod
+    def api_columns(cls) -> tuple:
+        """Columns read by the json_object list path, which skips ORM hydration.
+        
+        Timestamps shown to clients come back as ISO strings formatted by SQLite;
+        health_status is only the fallback for services not yet swept.
+        """
+        return (cls.id, cls.name, cls.owner, cls.language, cls.repo,
+                iso_timestamp(cls.created_at), iso_timestamp(cls.updated_at),
+                cls.deployed_version, iso_timestamp(cls.deployed_at),
+                cls.description, cls.tags, cls.health_status)
+    
+    @classmethod
+    def to_json_bulk(cls, page_stmt) -> str:
+        """Serialize a page of api_columns() rows to a JSON array inside SQLite.
+        
+        page_stmt is a lambda statement that may also select a swept_status
+        column. SQLite's json_object/json_group_array build the array and
+        return it as one string, so no Python objects are made per row.
+        Stored tags are already JSON, so json() embeds them as arrays.
+        """
+        page_stmt += lambda s: Service.json_array_select(s.subquery())
+        return db.session.execute(page_stmt).scalar()
+    
+    @staticmethod
+    def json_array_select(page):
+        """SELECT json_group_array(json_object(...)) over a page subquery"""
+        func = db.func
+        swept_status = page.c.get('swept_status')
+        status = page.c.health_status if swept_status is None else func.coalesce(swept_status, page.c.health_status)
+        return select(func.json_group_array(func.json_object(
+            'id', uuid_text(page.c.id),
+            'name', page.c.name,
+            'owner', page.c.owner,
+            'language', page.c.language,
+            'repo', page.c.repo,
+            'created_at', page.c.created_at,
+            'updated_at', page.c.updated_at,
+            'deployed_version', page.c.deployed_version,
+            'deployed_at', page.c.deployed_at,
+            'description', page.c.description,
+            'tags', db.case((func.json_valid(page.c.tags), func.json(page.c.tags)), else_=func.json_array()),
+            'status', status
+        )))
+    
+    @staticmethod
+    def _simulate_health() -> str:
+        """Simulate health check (30% chance of being unhealthy)"""
+        return 'healthy' if random.random() > 0.3 else 'unhealthy'
+    
+    @staticmethod
+    def _health_check_fresh(last_health_check: Optional[datetime]) -> bool:
+        """Whether a recorded health check is still within HEALTH_CHECK_TTL"""
+        return bool(last_health_check and datetime.utcnow() - last_health_check < HEALTH_CHECK_TTL)
+    
+    @staticmethod
+    def resolve_status(health_status: Optional[str], last_health_check: Optional[datetime]) -> str:
+        """Use cached status if recent (within 5 minutes), otherwise simulate"""
+        if Service._health_check_fresh(last_health_check):
+            return health_status
+        return Service._simulate_health()
+    
+    def current_status(self) -> str:
+        """Resolve status, remembering a simulated roll on this instance.
+        
+        The roll is stored as committed state, so it is reused for the rest of
+        the session without marking the row dirty or being flushed.
+        """
+        if self._health_check_fresh(self.last_health_check):
+            return self.health_status
+        status = self._simulate_health()
+        set_committed_value(self, 'health_status', status)
+        set_committed_value(self, 'last_health_check', datetime.utcnow())
+        return status
+    
     def parse_tags(self) -> List[str]:
-        """Parse tags from JSON string"""
-        if not self.tags:
-            return []
-        try:
-            return json.loads(self.tags)
-        except json.JSONDecodeError:
-            return []
+        """Tags as a list (the JSON column is decoded on load)"""
+        return self.tags or []
     
     def set_tags(self, tags: List[str]) -> None:
-        """Set tags as JSON string"""
-        self.tags = json.dumps(tags) if tags else None
+        """Set tags; the JSON column encodes them on flush"""
+        self.tags = list(tags) if tags else None
     
     @classmethod
     def create_service(cls, data: Dict[str, Any]) -> 'Service':
@@ -114,12 +315,14 @@ class Service(db.Model):
     
     def update_deployment(self, version: str) -> None:
         """Update service deployment information"""
+        # Whole seconds, as stored, so the deploy event payload matches the column
+        now = datetime.utcnow().replace(microsecond=0)
         self.deployed_version = version
-        self.deployed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.deployed_at = now
+        self.updated_at = now
         # Assume successful deployment means healthy service
         self.health_status = 'healthy'
-        self.last_health_check = datetime.utcnow()
+        self.last_health_check = now
     
     def update_health_status(self, status: str) -> None:
         """Update cached health status"""
@@ -127,22 +330,58 @@ class Service(db.Model):
         self.last_health_check = datetime.utcnow()
     
     @classmethod
-    def get_owners(cls) -> List[str]:
+    def find_by_name(cls, name: str) -> Optional['Service']:
+        """Look up a service by its unique name (compiled SQL is cached)"""
+        return db.session.scalars(lambda_stmt(
+            lambda: select(cls).where(cls.name == name).limit(1)
+        )).first()
+    
+    @classmethod
+    def with_events(cls):
+        """Query that loads each service's events with one batched IN query"""
+        return cls.query.options(selectinload(cls.events))
+    
+    @classmethod
+    def get_owners(cls) -> Tuple[str, ...]:
         """Get all unique owners for filtering"""
-        result = db.session.query(cls.owner).distinct().order_by(cls.owner).all()
-        return [row[0] for row in result]
+        return distinct_values(cls.owner)
     
     @classmethod
-    def get_languages(cls) -> List[str]:
+    def get_languages(cls) -> Tuple[str, ...]:
         """Get all unique languages for filtering"""
-        result = db.session.query(cls.language).distinct().order_by(cls.language).all()
-        return [row[0] for row in result]
+        return distinct_values(cls.language)
+    
+    @classmethod
+    def estimate_count(cls, fallback_limit: int = 1000) -> int:
+        """Estimate the number of services from ANALYZE statistics.
+        
+        Reads the row count recorded in sqlite_stat1 instead of scanning the
+        table. Before ANALYZE has run, counts at most fallback_limit rows.
+        """
+        try:
+            # Each index's stat starts with the rows it covers; a partial index
+            # (idx_deployed_at) covers fewer, so take the largest as the table's
+            rows = db.session.execute(db.text(
+                "SELECT MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 WHERE tbl = :table"
+            ), {'table': cls.__tablename__}).scalar()
+        except Exception:
+            # sqlite_stat1 only exists once ANALYZE has run
+            db.session.rollback()
+            rows = None
+        
+        if rows:
+            return rows
+        
+        return db.session.execute(db.text(
+            f"SELECT COUNT(*) FROM (SELECT 1 FROM {cls.__tablename__} LIMIT :limit)"
+        ), {'limit': fallback_limit}).scalar()
     
     @classmethod
     def get_deployment_stats(cls) -> Dict[str, int]:
-        """Get deployment statistics"""
-        deployed_count = db.session.query(cls).filter(cls.deployed_version.isnot(None)).count()
-        total_count = db.session.query(cls).count()
+        """Get deployment statistics in one scan (COUNT(column) skips NULLs)"""
+        total_count, deployed_count = db.session.execute(lambda_stmt(
+            lambda: select(db.func.count(), db.func.count(cls.deployed_version)).select_from(cls)
+        )).one()
         return {
             'total_services': total_count,
             'deployed_services': deployed_count,
@@ -150,18 +389,71 @@ class Service(db.Model):
         }
 
 
+# Filter dropdown values are memoized against a version counter that this
+# process bumps whenever a Service write commits. Other worker processes can
+# write too, so entries also expire after DISTINCT_CACHE_TTL seconds.
+DISTINCT_CACHE_TTL = 30
+services_version = 0
+distinct_cache: Dict[str, Tuple[int, float, Tuple[str, ...]]] = {}
+
+def distinct_values(column) -> Tuple[str, ...]:
+    """Sorted DISTINCT values of a services column, cached per version"""
+    now = time.monotonic()
+    cached = distinct_cache.get(column.key)
+    if cached and cached[0] == services_version and now - cached[1] < DISTINCT_CACHE_TTL:
+        return cached[2]
+    
+    # Read the version first so a write committed mid-query invalidates us
+    version = services_version
+    values = tuple(db.session.scalars(lambda_stmt(
+        lambda: select(column).distinct().order_by(column)
+    )))
+    distinct_cache[column.key] = (version, now, values)
+    return values
+
+@event.listens_for(Service, 'after_insert')
+@event.listens_for(Service, 'after_update')
+def mark_services_changed(mapper, connection, target):
+    """Flag the session so its commit bumps services_version"""
+    object_session(target).info['services_changed'] = True
+
+@event.listens_for(RoutingSession, 'after_commit')
+def bump_services_version(session):
+    global services_version
+    if session.info.pop('services_changed', False):
+        services_version += 1
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def discard_services_changed(session):
+    session.info.pop('services_changed', None)
+
+
 class ServiceEvent(db.Model):
     """Model for tracking service events and history"""
     
     __tablename__ = 'service_events'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    service_id = db.Column(db.String(36), db.ForeignKey('services.id'), nullable=False)
+    EVENT_TYPES = ('created', 'deployed', 'updated', 'health_check')
+    
+    id = db.Column(UUIDBlob, primary_key=True, server_default=RANDOM_ID)
+    service_id = db.Column(UUIDBlob, db.ForeignKey('services.id'), nullable=False)
     event_type = db.Column(db.String(50), nullable=False)  # 'created', 'deployed', 'updated', 'health_check'
-    event_data = db.Column(db.Text, nullable=True)  # JSON string of event details
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    event_data = db.Column(db.JSON(none_as_null=True), nullable=True)  # Event details
+    created_at = db.Column(UnixDateTime, nullable=False, default=datetime.utcnow)
     created_by = db.Column(db.String(100), nullable=True)  # User who triggered the event
     
+    # Copied from the service so activity feeds never join services;
+    # kept in sync by sync_event_service_details
+    service_name = db.Column(db.String(100), nullable=True)
+    service_owner = db.Column(db.String(100), nullable=True)
+    
+    # Hot event_data keys exposed as indexed generated columns, so filtering on
+    # them is an index seek rather than a scan that parses every JSON payload
+    event_version = db.Column(
+        db.String(50), db.Computed("json_extract(event_data, '$.version')", persisted=True),
+        index=True
+    )
+    
     # Relationships
     service = db.relationship('Service', backref=db.backref('events', lazy=True, order_by='ServiceEvent.created_at.desc()'))
     
@@ -169,6 +461,7 @@ class ServiceEvent(db.Model):
     __table_args__ = (
         db.Index('idx_service_events', 'service_id', 'created_at'),
         db.Index('idx_event_type_date', 'event_type', 'created_at'),
+        db.Index('idx_event_created', 'created_at'),
     )
     
     def __repr__(self):
@@ -179,19 +472,43 @@ class ServiceEvent(db.Model):
         return {
             'id': self.id,
             'service_id': self.service_id,
+            'service_name': self.service_name,
+            'service_owner': self.service_owner,
             'event_type': self.event_type,
-            'event_data': json.loads(self.event_data) if self.event_data else None,
+            'event_data': self.event_data,
             'created_at': self.created_at.isoformat(),
             'created_by': self.created_by
         }
     
     @classmethod
-    def log_event(cls, service_id: str, event_type: str, event_data: Optional[Dict] = None, created_by: Optional[str] = None) -> 'ServiceEvent':
+    def api_columns(cls) -> tuple:
+        """Columns read by event feeds, which skip ORM hydration"""
+        return (cls.id, cls.service_id, cls.service_name, cls.service_owner, cls.event_type,
+                cls.event_data, iso_timestamp(cls.created_at), cls.created_by)
+    
+    @staticmethod
+    def row_to_dict(row) -> Dict[str, Any]:
+        """Convert a row of api_columns() to the same shape as to_dict()"""
+        return {
+            'id': row.id,
+            'service_id': row.service_id,
+            'service_name': row.service_name,
+            'service_owner': row.service_owner,
+            'event_type': row.event_type,
+            'event_data': row.event_data,
+            'created_at': row.created_at,
+            'created_by': row.created_by
+        }
+    
+    @classmethod
+    def log_event(cls, service: 'Service', event_type: str, event_data: Optional[Dict] = None, created_by: Optional[str] = None) -> 'ServiceEvent':
         """Log a new service event"""        
         event = cls(
-            service_id=service_id,
+            service_id=service.id,
+            service_name=service.name,
+            service_owner=service.owner,
             event_type=event_type,
-            event_data=json.dumps(event_data) if event_data else None,
+            event_data=event_data or None,
             created_by=created_by
         )
         return event
@@ -199,30 +516,124 @@ class ServiceEvent(db.Model):
     @classmethod
     def get_recent_deployments(cls, limit: int = 10) -> List['ServiceEvent']:
         """Get recent deployment events"""
-        return cls.query.filter_by(event_type='deployed').order_by(cls.created_at.desc()).limit(limit).all()
+        return db.session.scalars(lambda_stmt(
+            lambda: select(cls).where(cls.event_type == 'deployed')
+            .order_by(cls.created_at.desc()).limit(limit)
+        )).all()
     
     @classmethod
     def get_activity_summary(cls, days: int = 30) -> Dict[str, int]:
-        """Get activity summary for the last N days"""
-        from sqlalchemy import func
-        
+        """Count events per type over the last N days (zero for types with none)"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        result = db.session.query(
-            cls.event_type,
-            func.count(cls.id).label('count')
-        ).filter(
-            cls.created_at >= cutoff_date
-        ).group_by(cls.event_type).all()
+        counts = db.session.execute(lambda_stmt(
+            lambda: select(cls.event_type, db.func.count())
+            .where(cls.created_at >= cutoff_date)
+            .group_by(cls.event_type)
+        )).all()
+        return {**dict.fromkeys(cls.EVENT_TYPES, 0), **dict(counts)}
+
+
+@event.listens_for(Service, 'after_update')
+def sync_event_service_details(mapper, connection, target):
+    """Copy a renamed or re-owned service's details onto its events"""
+    state = db.inspect(target)
+    if state.attrs.name.history.has_changes() or state.attrs.owner.history.has_changes():
+        events = ServiceEvent.__table__
+        connection.execute(
+            update(events)
+            .where(events.c.service_id == target.id)
+            .values(service_name=target.name, service_owner=target.owner)
+        )
+
+
+class ServiceHealth(db.Model):
+    """Rolling per-service health status, refreshed by a background sweep"""
+    
+    __tablename__ = 'service_health'
+    
+    service_id = db.Column(UUIDBlob, db.ForeignKey('services.id'), primary_key=True)
+    status = db.Column(db.String(20), nullable=False)  # 'healthy', 'unhealthy'
+    checked_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    
+    # Index-only scan for the status summary
+    __table_args__ = (
+        db.Index('idx_health_status', 'status'),
+        # Covers the list endpoint's per-service join, status filter included
+        db.Index('idx_health_service_status', 'service_id', 'status'),
+    )
+    
+    def __repr__(self):
+        return f'<ServiceHealth {self.service_id} {self.status}>'
+    
+    @classmethod
+    def refresh(cls) -> int:
+        """Re-check every service and upsert its status; returns rows written"""
+        now = datetime.utcnow()
+        rows = [
+            {
+                'service_id': service_id,
+                'status': Service.resolve_status(health_status, last_health_check),
+                'checked_at': now
+            }
+            for service_id, health_status, last_health_check in db.session.execute(
+                select(Service.id, Service.health_status, Service.last_health_check)
+            )
+        ]
+        if not rows:
+            return 0
         
-        return {row[0]: row[1] for row in result}
+        stmt = sqlite_insert(cls)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.service_id],
+            set_={'status': stmt.excluded.status, 'checked_at': stmt.excluded.checked_at}
+        )
+        db.session.execute(stmt, rows)
+        db.session.commit()
+        return len(rows)
+    
+    @classmethod
+    def get_status_counts(cls) -> Dict[str, int]:
+        """Count services per health status"""
+        return dict(db.session.execute(lambda_stmt(
+            lambda: select(cls.status, db.func.count()).group_by(cls.status)
+        )).all())
+
+
+class MaintenanceJob(db.Model):
+    """Model for tracking background database maintenance runs"""
+    
+    __tablename__ = 'maintenance_jobs'
+    
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    job_type = db.Column(db.String(50), nullable=False)  # 'vacuum'
+    status = db.Column(db.String(20), nullable=False, default='queued')  # 'queued', 'running', 'completed', 'failed'
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f'<MaintenanceJob {self.job_type} {self.status}>'
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert job to dictionary for API responses"""
+        return {
+            'job_id': self.id,
+            'job_type': self.job_type,
+            'status': self.status,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
 
 
 def init_sample_data():
     """Initialize database with sample data for demonstration"""
     
-    # Check if we already have data
-    if Service.query.first():
+    # Check if we already have data (EXISTS stops at the first index entry)
+    if db.session.execute(select(select(Service.id).exists())).scalar():
         return
     
     sample_services = [
@@ -268,72 +679,204 @@ def init_sample_data():
         }
     ]
     
-    created_services = []
-    
-    # First, create all services and commit them to get proper IDs
+    sample_deployments = {
+        'auth-service': 'v1.2.3',
+        'notification-service': 'v2.1.0'
+    }
+    
+    # Build plain rows up front so services and their events can each be
+    # written with a single executemany INSERT; SQLite generates the IDs.
+    # Timestamps are stored as whole seconds, so truncate before they are
+    # also copied into event payloads.
+    now = datetime.utcnow().replace(microsecond=0)
+    service_rows = []
     for service_data in sample_services:
-        service = Service.create_service(service_data)
-        db.session.add(service)
-        created_services.append(service)
-    
-    # Commit services first to ensure they have IDs
+        deployed_version = sample_deployments.get(service_data['name'])
+        
+        service_rows.append({
+            'name': service_data['name'],
+            'owner': service_data['owner'],
+            'language': service_data['language'],
+            'repo': service_data['repo'],
+            'description': service_data['description'],
+            'tags': service_data['tags'],
+            'created_at': now,
+            'updated_at': now,
+            'deployed_version': deployed_version,
+            'deployed_at': now if deployed_version else None,
+            # Assume successful deployment means healthy service
+            'health_status': 'healthy' if deployed_version else 'unknown',
+            'last_health_check': now if deployed_version else None
+        })
+    
+    # Services and events are inserted in one transaction
     try:
-        db.session.commit()
+        service_ids = dict(db.session.execute(
+            insert(Service).returning(Service.name, Service.id), service_rows
+        ).all())
         print("✅ Sample services created")
-    except Exception as e:
-        db.session.rollback()
-        print(f"❌ Error creating sample services: {e}")
-        return
-    
-    # Now create events for the services that have proper IDs
-    try:
-        for service in created_services:
+        
+        event_rows = []
+        for service_data in sample_services:
+            service_id = service_ids[service_data['name']]
+            deployed_version = sample_deployments.get(service_data['name'])
+            
             # Add creation event
-            event = ServiceEvent.log_event(
-                service_id=service.id,
-                event_type='created',
-                event_data={
-                    'name': service.name,
-                    'owner': service.owner,
-                    'language': service.language
-                }
-            )
-            db.session.add(event)
+            event_rows.append({
+                'service_id': service_id,
+                'service_name': service_data['name'],
+                'service_owner': service_data['owner'],
+                'event_type': 'created',
+                'event_data': {
+                    'name': service_data['name'],
+                    'owner': service_data['owner'],
+                    'language': service_data['language']
+                },
+                'created_at': now,
+                'created_by': None
+            })
             
             # Deploy some services
-            if service.name in ['auth-service', 'notification-service']:
-                service.update_deployment('v1.2.3' if service.name == 'auth-service' else 'v2.1.0')
-                
-                deploy_event = ServiceEvent.log_event(
-                    service_id=service.id,
-                    event_type='deployed',
-                    event_data={
-                        'version': service.deployed_version,
-                        'deployed_at': service.deployed_at.isoformat()
-                    }
-                )
-                db.session.add(deploy_event)
+            if deployed_version:
+                event_rows.append({
+                    'service_id': service_id,
+                    'service_name': service_data['name'],
+                    'service_owner': service_data['owner'],
+                    'event_type': 'deployed',
+                    'event_data': {
+                        'version': deployed_version,
+                        'deployed_at': now.isoformat()
+                    },
+                    'created_at': now,
+                    'created_by': None
+                })
         
+        db.session.execute(insert(ServiceEvent), event_rows)
         db.session.commit()
         print("✅ Sample events created")
-        
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Error creating sample events: {e}")
+        print(f"❌ Error creating sample data: {e}")
         return
 
 
+# Indexes that existing databases may still carry but the models no longer define
+RETIRED_INDEXES = (
+    'idx_health_created',  # health_status is only a fallback; status lives in service_health
+    'ix_services_deployed_at',  # replaced by the partial idx_deployed_at
+    'idx_owner_language',  # prefix of idx_owner_lang_created
+    'ix_services_owner',  # prefix of idx_owner_created
+    'ix_services_language',  # prefix of idx_language_created
+    'idx_event_type_date_name',  # no feed reads service_name through it; idx_event_type_date suffices
+)
+
+
+def rebuild_table(conn, table, converters: Optional[Dict[str, str]] = None) -> None:
+    """Recreate a table from its model definition, copying its rows across.
+    
+    SQLite can't change a column's type or default in place, so this follows
+    its documented recipe: create the new table, copy, drop the old one and
+    rename. converters maps a column name to the SQL expression that reads
+    its old value. Indexes go with the old table; ensure_indexes() recreates them.
+    """
+    # Copy every model table so foreign keys in the new DDL can resolve
+    metadata = db.MetaData()
+    for model_table in db.metadata.sorted_tables:
+        model_table.to_metadata(metadata)
+    new_table = table.to_metadata(metadata, name=f'{table.name}_new')
+    
+    # Generated columns are recomputed by SQLite, never copied
+    existing = {row[1] for row in conn.execute(db.text(f'PRAGMA table_xinfo({table.name})'))}
+    columns = [column.name for column in table.columns
+               if column.name in existing and column.computed is None]
+    sources = [(converters or {}).get(name, name) for name in columns]
+    
+    conn.execute(CreateTable(new_table))
+    conn.execute(db.text(
+        f'INSERT INTO {new_table.name} ({", ".join(columns)}) '
+        f'SELECT {", ".join(sources)} FROM {table.name}'
+    ))
+    conn.execute(db.text(f'DROP TABLE {table.name}'))
+    conn.execute(db.text(f'ALTER TABLE {new_table.name} RENAME TO {table.name}'))
+
+
+def migrate_schema():
+    """Rebuild tables whose on-disk definition predates a model change"""
+    with db.engine.begin() as conn:
+        # SQLite 3.40 has no unhex(), so text UUIDs are converted in Python
+        conn.connection.driver_connection.create_function(
+            'uuid_blob', 1, lambda value: uuid.UUID(value).bytes if value else None,
+            deterministic=True
+        )
+        
+        for table in (Service.__table__, ServiceEvent.__table__, ServiceHealth.__table__):
+            # PRAGMA table_xinfo rows: (cid, name, type, notnull, default, pk, hidden);
+            # unlike table_info it also lists generated columns
+            on_disk = {row[1]: row for row in conn.execute(db.text(f'PRAGMA table_xinfo({table.name})'))}
+            
+            converters = {}
+            for column in table.columns:
+                if column.name not in on_disk:
+                    continue
+                declared_type = on_disk[column.name][2]
+                # Timestamps written as ISO text before they became unix seconds
+                if isinstance(column.type, UnixDateTime) and declared_type != 'BIGINT':
+                    converters[column.name] = f"CAST(strftime('%s', {column.name}) AS INTEGER)"
+                # IDs written as text before they became 16-byte blobs (these
+                # tables also predate the SQLite-generated id default)
+                elif isinstance(column.type, UUIDBlob) and declared_type != 'BLOB':
+                    converters[column.name] = f'uuid_blob({column.name})'
+            
+            # Columns added to the model since the table was created
+            missing = [column.name for column in table.columns if column.name not in on_disk]
+            
+            # Columns whose SQL default has changed (e.g. ids from plain
+            # randomblob(16) before they became version 4 UUIDs); SQLite reports
+            # a parenthesized default without its outer parentheses
+            stale_defaults = [
+                column.name for column in table.columns
+                if isinstance(column.server_default, DefaultClause) and column.name in on_disk
+                and f'({on_disk[column.name][4]})' != str(column.server_default.arg)
+            ]
+            
+            if converters or missing or stale_defaults:
+                rebuild_table(conn, table, converters)
+            
+            if table is ServiceEvent.__table__ and 'service_name' in missing:
+                conn.execute(db.text(
+                    'UPDATE service_events SET (service_name, service_owner) = '
+                    '(SELECT name, owner FROM services WHERE services.id = service_events.service_id)'
+                ))
+
+
+def ensure_indexes():
+    """Bring an existing database's indexes in line with the models"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+    
+    with db.engine.connect() as conn:
+        for index_name in RETIRED_INDEXES:
+            conn.execute(db.text(f'DROP INDEX IF EXISTS {index_name}'))
+        conn.commit()
+
+
 def optimize_database():
     """Apply SQLite-specific optimizations"""
+    # Databases created before a model change need their tables and indexes
+    # brought up to date. A failed migration must abort initialization rather
+    # than leave the app serving the new models against the old schema.
+    migrate_schema()
+    ensure_indexes()
+    
     try:
-        # Enable WAL mode for better concurrent access
+        # Persist WAL mode and refresh planner statistics in one script.
+        # Per-connection settings (cache, mmap, temp store) come from
+        # CONNECTION_PRAGMAS whenever the pool opens a connection.
         with db.engine.connect() as conn:
-            conn.execute(db.text('PRAGMA journal_mode=WAL'))
-            conn.execute(db.text('PRAGMA synchronous=NORMAL'))
-            conn.execute(db.text('PRAGMA cache_size=10000'))
-            conn.execute(db.text('PRAGMA temp_store=memory'))
-            conn.execute(db.text('ANALYZE'))
-            conn.commit()
+            conn.connection.driver_connection.executescript(
+                'PRAGMA journal_mode=WAL; ANALYZE; PRAGMA optimize;'
+            )
         
         print("✅ Database optimizations applied")
     except Exception as e:
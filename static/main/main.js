@@ -127,9 +127,9 @@ function formatActivityTitle(activity) {
         case 'created':
             return `New service "${eventData.name || 'Unknown'}" created by ${eventData.owner || 'Unknown'}`;
         case 'deployed':
-            return `Service deployed version ${eventData.version || 'Unknown'}`;
+            return `Service "${activity.service_name || 'Unknown'}" deployed version ${eventData.version || 'Unknown'}`;
         case 'updated':
-            return `Service updated`;
+            return `Service "${activity.service_name || 'Unknown'}" updated`;
         default:
             return `Service ${activity.event_type}`;
     }